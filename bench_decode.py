@@ -0,0 +1,103 @@
+"""
+Per-symbol parse time and peak allocation: the pandas decode each path replaced vs decode.py.
+Uses synthetic 1000-bar payloads, no network:  python bench_decode.py
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import time
+import tracemalloc
+
+import pandas as pd
+
+from decode import decode_binance_klines, decode_yahoo_chart
+
+
+BARS = 1000
+REPEAT = 200
+
+
+def _binance_payload() -> bytes:
+	t0 = 1_700_000_000_000
+	rows = []
+	for i in range(BARS):
+		o = random.uniform(10, 100)
+		rows.append([
+			t0 + i * 3_600_000, f"{o:.8f}", f"{o * 1.01:.8f}", f"{o * 0.99:.8f}", f"{o:.8f}", f"{random.uniform(1, 1e5):.8f}",
+			t0 + (i + 1) * 3_600_000 - 1, "0.0", 100, "0.0", "0.0", "0",
+		])
+	return json.dumps(rows, separators=(",", ":")).encode()
+
+
+def _yahoo_payload() -> bytes:
+	t0 = 1_700_000_000
+	closes = [round(random.uniform(10, 100), 2) for _ in range(BARS)]
+	closes[5] = None  # halted bar
+	quote = {c: list(closes) for c in ["open", "high", "low", "close"]}
+	quote["volume"] = [random.randint(0, 10**6) for _ in range(BARS)]
+	body = {"chart": {"result": [{"timestamp": [t0 + i * 3600 for i in range(BARS)], "indicators": {"quote": [quote]}}]}}
+	return json.dumps(body).encode()
+
+
+def legacy_binance(payload: bytes) -> pd.DataFrame:
+	# Previous fetch_binance_klines body
+	df = pd.DataFrame(
+		json.loads(payload),
+		columns=["open_time", "open", "high", "low", "close", "volume", "close_time", "qav", "num_trades", "taker_base", "taker_quote", "ignore"],
+	)
+	df["open_time"] = pd.to_datetime(df["open_time"], unit="ms", utc=True)
+	df.set_index("open_time", inplace=True)
+	for col in ["open", "high", "low", "close", "volume"]:
+		df[col] = df[col].astype(float)
+	return df[["open", "high", "low", "close", "volume"]]
+
+
+def legacy_yahoo(payload: bytes) -> pd.DataFrame:
+	# Previous _fetch_yahoo_chart body (json -> DataFrame -> dropna)
+	result = (json.loads(payload).get("chart") or {}).get("result") or []
+	if not result or not result[0].get("timestamp"):
+		return None
+	res = result[0]
+	quote = res["indicators"]["quote"][0]
+	df = pd.DataFrame(
+		{col: quote.get(col) for col in ["open", "high", "low", "close", "volume"]},
+		index=pd.to_datetime(res["timestamp"], unit="s", utc=True),
+		dtype=float,
+	)
+	return df.dropna(subset=["close"])
+
+
+def _measure(fn, payload: bytes):
+	fn(payload)  # warm up
+	t = time.perf_counter()
+	for _ in range(REPEAT):
+		fn(payload)
+	per_call = (time.perf_counter() - t) / REPEAT
+	tracemalloc.start()
+	fn(payload)
+	_, peak = tracemalloc.get_traced_memory()
+	tracemalloc.stop()
+	return per_call, peak
+
+
+def main():
+	random.seed(0)
+	cases = [
+		("binance klines", _binance_payload(), legacy_binance, decode_binance_klines),
+		("yahoo chart", _yahoo_payload(), legacy_yahoo, decode_yahoo_chart),
+	]
+	print(f"{BARS} bars, {REPEAT} runs")
+	for name, payload, old, new in cases:
+		old_t, old_peak = _measure(old, payload)
+		new_t, new_peak = _measure(new, payload)
+		view_t, view_peak = _measure(lambda p: new(p).to_frame(), payload)
+		print(f"[{name}]")
+		print(f"  legacy pandas   {old_t * 1e3:7.3f} ms  peak {old_peak / 1024:8.1f} KiB")
+		print(f"  arrays          {new_t * 1e3:7.3f} ms  peak {new_peak / 1024:8.1f} KiB  ({old_t / new_t:.1f}x faster)")
+		print(f"  arrays + frame  {view_t * 1e3:7.3f} ms  peak {view_peak / 1024:8.1f} KiB  ({old_t / view_t:.1f}x faster)")
+
+
+if __name__ == "__main__":
+	main()
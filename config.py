@@ -34,3 +34,42 @@ BIST_LIST_PATH = os.getenv("BIST_LIST_PATH", "BİST.txt")
 MIDAS_LIST_PATH = os.getenv("MIDAS_LIST_PATH", "MİDAS COİN YENİ.txt")
 
 
+# Scan scheduling (worker): per-cycle time budget in seconds (0 = no limit)
+SCAN_BUDGET_SECS = float(os.getenv("SCAN_BUDGET_SECS", 0))
+# Priority weights for ordering (symbol, timeframe) work
+PRIORITY_WEIGHT_LIQUIDITY = float(os.getenv("PRIORITY_WEIGHT_LIQUIDITY", 1.0))
+PRIORITY_WEIGHT_SIGNALS = float(os.getenv("PRIORITY_WEIGHT_SIGNALS", 1.0))
+PRIORITY_WEIGHT_TIMEFRAME = float(os.getenv("PRIORITY_WEIGHT_TIMEFRAME", 0.5))
+PRIORITY_WEIGHT_STALENESS = float(os.getenv("PRIORITY_WEIGHT_STALENESS", 1.5))
+PRIORITY_WEIGHT_PINNED = float(os.getenv("PRIORITY_WEIGHT_PINNED", 1.0))
+# Relative importance of each timeframe (shorter bars close more often)
+TIMEFRAME_PRIORITY = {
+	"1h": 1.0,
+	"4h": 0.75,
+	"1d": 0.5,
+	"1w": 0.25,
+}
+# Symbols always boosted, comma-separated display symbols (Binance majors added from symbols.py)
+PRIORITY_SYMBOLS = [s.strip() for s in os.getenv("PRIORITY_SYMBOLS", "THYAO.IS,AKBNK.IS,GARAN.IS,ASELS.IS,BIMAS.IS,KCHOL.IS").split(",") if s.strip()]
+# Per-scan decay factor of the recent-signal counter
+SIGNAL_DECAY = float(os.getenv("SIGNAL_DECAY", 0.9))
+# Provider endpoints for hedged requests / failover (comma-separated base URLs)
+BINANCE_ENDPOINTS = [s.strip() for s in os.getenv(
+	"BINANCE_ENDPOINTS",
+	"https://api.binance.com,https://api1.binance.com,https://api2.binance.com,https://api3.binance.com,https://api4.binance.com",
+).split(",") if s.strip()]
+YAHOO_ENDPOINTS = [s.strip() for s in os.getenv(
+	"YAHOO_ENDPOINTS",
+	"https://query1.finance.yahoo.com,https://query2.finance.yahoo.com",
+).split(",") if s.strip()]
+# Hedging: duplicate a request to another endpoint once it exceeds the rolling p95 latency
+HEDGE_ENABLED = os.getenv("HEDGE_ENABLED", "true").lower() in {"1", "true", "yes"}
+HEDGE_DEFAULT_DELAY_SECS = float(os.getenv("HEDGE_DEFAULT_DELAY_SECS", 1.0))  # until enough samples
+HEDGE_MIN_DELAY_SECS = float(os.getenv("HEDGE_MIN_DELAY_SECS", 0.1))
+HEDGE_MAX_ATTEMPTS = int(os.getenv("HEDGE_MAX_ATTEMPTS", 3))
+LATENCY_WINDOW = int(os.getenv("LATENCY_WINDOW", 200))
+# Circuit breaker: open after N consecutive failures, retry after cooldown
+CIRCUIT_FAIL_THRESHOLD = int(os.getenv("CIRCUIT_FAIL_THRESHOLD", 3))
+CIRCUIT_COOLDOWN_SECS = float(os.getenv("CIRCUIT_COOLDOWN_SECS", 30))
+# Client-wide backoff on 429/418 when the response carries no Retry-After
+RATE_LIMIT_BACKOFF_SECS = float(os.getenv("RATE_LIMIT_BACKOFF_SECS", 60))
@@ -8,7 +8,15 @@ import pandas as pd
 import requests
 import yfinance as yf
 
-from config import REQUEST_TIMEOUT_SECS
+from config import BINANCE_ENDPOINTS, YAHOO_ENDPOINTS
+from decode import OHLCV, decode_binance_klines, decode_yahoo_chart, empty_ohlcv
+from hedging import HedgedClient, RateLimitedError
+
+
+_binance = HedgedClient(BINANCE_ENDPOINTS)
+_yahoo = HedgedClient(YAHOO_ENDPOINTS)
+# Yahoo's chart API rejects the default python-requests agent
+_YAHOO_HEADERS = {"User-Agent": "Mozilla/5.0"}
 
 
 def _now_utc() -> datetime:
@@ -28,7 +36,7 @@ def _interval_to_minutes(tf: str) -> int:
 @lru_cache(maxsize=1)
 def _binance_symbol_set() -> set[str]:
 	try:
-		r = requests.get("https://api.binance.com/api/v3/exchangeInfo", timeout=REQUEST_TIMEOUT_SECS)
+		r = _binance.get("/api/v3/exchangeInfo")
 		r.raise_for_status()
 		data = r.json()
 		return {s.get("symbol", "") for s in data.get("symbols", [])}
@@ -40,7 +48,7 @@ def _empty_ohlcv_df() -> pd.DataFrame:
 	return pd.DataFrame(columns=["open", "high", "low", "close", "volume"])  # noqa: N815
 
 
-def fetch_binance_klines(symbol: str, timeframe: str, limit: int = 1000) -> pd.DataFrame:
+def resolve_binance_symbol(symbol: str) -> str | None:
 	# symbol like "BTCUSDT" or "BTCTRY"; validate and fallback TRY->USDT if needed
 	available = _binance_symbol_set()
 	use_symbol = symbol.upper()
@@ -49,39 +57,37 @@ def fetch_binance_klines(symbol: str, timeframe: str, limit: int = 1000) -> pd.D
 		if use_symbol.endswith("TRY"):
 			alt = use_symbol[:-3] + "USDT"
 		if alt not in available:
-			return _empty_ohlcv_df()
+			return None
 		use_symbol = alt
+	return use_symbol
+
+
+def fetch_binance_ohlcv(symbol: str, timeframe: str, limit: int = 1000) -> OHLCV:
+	use_symbol = resolve_binance_symbol(symbol)
+	if use_symbol is None:
+		return empty_ohlcv("open_time")
 
-	url = "https://api.binance.com/api/v3/klines"
 	params = {"symbol": use_symbol, "interval": timeframe, "limit": limit}
 	try:
-		r = requests.get(url, params=params, timeout=REQUEST_TIMEOUT_SECS)
+		r = _binance.get("/api/v3/klines", params=params)
 		r.raise_for_status()
-		arr = r.json()
 	except requests.HTTPError:
-		return _empty_ohlcv_df()
-	df = pd.DataFrame(
-		arr,
-		columns=[
-			"open_time",
-			"open",
-			"high",
-			"low",
-			"close",
-			"volume",
-			"close_time",
-			"qav",
-			"num_trades",
-			"taker_base",
-			"taker_quote",
-			"ignore",
-		],
+		return empty_ohlcv("open_time")
+	return decode_binance_klines(r.content)
+
+
+def fetch_binance_klines(symbol: str, timeframe: str, limit: int = 1000) -> pd.DataFrame:
+	return fetch_binance_ohlcv(symbol, timeframe, limit).to_frame()
+
+
+def _fetch_yahoo_chart(symbol: str, intv: str) -> OHLCV:
+	r = _yahoo.get(
+		f"/v8/finance/chart/{symbol}",
+		params={"interval": intv, "range": "730d", "includePrePost": "false"},
+		headers=_YAHOO_HEADERS,
 	)
-	df["open_time"] = pd.to_datetime(df["open_time"], unit="ms", utc=True)
-	df.set_index("open_time", inplace=True)
-	for col in ["open", "high", "low", "close", "volume"]:
-		df[col] = df[col].astype(float)
-	return df[["open", "high", "low", "close", "volume"]]
+	r.raise_for_status()
+	return decode_yahoo_chart(r.content, daily=intv in ("1d", "1wk"))
 
 
 def fetch_yahoo(symbol: str, timeframe: str, limit: int = 1000) -> pd.DataFrame:
@@ -98,7 +104,21 @@ def fetch_yahoo(symbol: str, timeframe: str, limit: int = 1000) -> pd.DataFrame:
 		intv = "1wk"
 	else:
 		intv = "1d"
-	
+
+	# Primary source is Yahoo's v8 chart API over hedged query1/query2 hosts (yfinance cannot pick
+	# a host); yf.download is the fallback. 1d/1wk chart bars are stamped at UTC midnight of the
+	# exchange-local date, like the yfinance path below, so the notifier's symbol:tf:bar_time key
+	# is the same whichever path served the bar.
+	try:
+		bars = _fetch_yahoo_chart(symbol, intv)
+	except RateLimitedError:
+		# yfinance would spend the same per-IP budget
+		return _empty_ohlcv_df()
+	except Exception:
+		bars = None
+	if bars is not None and len(bars) > 0:
+		return bars.tail(limit).to_frame()
+
 	try:
 		import warnings
 		with warnings.catch_warnings():
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import json
+import warnings
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+
+OHLCV_COLUMNS = ["open", "high", "low", "close", "volume"]
+_KLINE_WIDTH = 12  # Binance kline row: open_time, o, h, l, c, v, close_time, qav, trades, taker_base, taker_quote, ignore
+
+
+@dataclass
+class OHLCV:
+	"""Typed bar arrays; `time` is epoch milliseconds (int64), the rest float64."""
+	time: np.ndarray
+	open: np.ndarray
+	high: np.ndarray
+	low: np.ndarray
+	close: np.ndarray
+	volume: np.ndarray
+	index_name: Optional[str] = None
+
+	def __len__(self) -> int:
+		return len(self.time)
+
+	def tail(self, n: int) -> "OHLCV":
+		if n >= len(self):
+			return self
+		return OHLCV(*(a[-n:] for a in self._arrays()), index_name=self.index_name)
+
+	def _arrays(self):
+		return (self.time, self.open, self.high, self.low, self.close, self.volume)
+
+	def to_frame(self) -> pd.DataFrame:
+		# Built on demand; columns wrap the float64 arrays, no object intermediates
+		index = pd.to_datetime(self.time, unit="ms", utc=True)
+		index.name = self.index_name
+		return pd.DataFrame(
+			{"open": self.open, "high": self.high, "low": self.low, "close": self.close, "volume": self.volume},
+			index=index,
+			copy=False,
+		)
+
+
+def empty_ohlcv(index_name: Optional[str] = None) -> OHLCV:
+	f = np.empty(0, dtype=np.float64)
+	return OHLCV(np.empty(0, dtype=np.int64), f, f, f, f, f, index_name=index_name)
+
+
+def _from_matrix(m: np.ndarray, index_name: Optional[str]) -> OHLCV:
+	# ms timestamps (~1.7e12) are exact in float64
+	return OHLCV(
+		time=m[:, 0].astype(np.int64),
+		open=np.ascontiguousarray(m[:, 1]),
+		high=np.ascontiguousarray(m[:, 2]),
+		low=np.ascontiguousarray(m[:, 3]),
+		close=np.ascontiguousarray(m[:, 4]),
+		volume=np.ascontiguousarray(m[:, 5]),
+		index_name=index_name,
+	)
+
+
+def _kline_rows(payload: bytes) -> int:
+	"""
+	Number of rows if the body is a list of rows with exactly _KLINE_WIDTH fields each, else -1.
+	Guards the flat parse: a schema change or ragged rows would otherwise shift columns silently.
+	Works on byte positions, so no per-row objects are created.
+	"""
+	buf = np.frombuffer(payload, dtype=np.uint8)
+	opens = np.flatnonzero(buf == ord("["))[1:]  # first "[" is the outer list
+	closes = np.flatnonzero(buf == ord("]"))[:-1]
+	if len(opens) == 0 or len(opens) != len(closes):
+		return -1
+	bounds = np.empty(2 * len(opens), dtype=np.intp)
+	bounds[0::2] = opens
+	bounds[1::2] = closes
+	if not (np.diff(bounds) > 0).all():  # properly nested, one level deep
+		return -1
+	commas = np.flatnonzero(buf == ord(","))
+	per_row = np.searchsorted(commas, closes) - np.searchsorted(commas, opens)
+	if not (per_row == _KLINE_WIDTH - 1).all():
+		return -1
+	return len(opens)
+
+
+def decode_binance_klines(payload: bytes) -> OHLCV:
+	"""
+	Parse a /api/v3/klines body straight into arrays.
+	Every field is numeric (prices are quoted strings), so dropping quotes and brackets
+	leaves a flat comma-separated list numpy parses in one pass without per-field objects.
+	That path is only taken when every row has exactly 12 fields; otherwise json decides.
+	"""
+	n_rows = _kline_rows(payload)
+	if n_rows > 0:
+		flat = payload.translate(None, b'"[] \n\r\t')
+		try:
+			with warnings.catch_warnings():
+				# Older numpy only warns on unparsable text; treat that as a failure too
+				warnings.simplefilter("error", DeprecationWarning)
+				values = np.fromstring(flat, dtype=np.float64, sep=",")
+		except (ValueError, DeprecationWarning):
+			values = None
+		if values is not None and values.size == n_rows * _KLINE_WIDTH:
+			return _from_matrix(values.reshape(-1, _KLINE_WIDTH), "open_time")
+	rows = json.loads(payload)
+	if not isinstance(rows, list) or not rows:
+		return empty_ohlcv("open_time")
+	m = np.array([r[:6] for r in rows], dtype=np.float64)
+	return _from_matrix(m, "open_time")
+
+
+_DAY_MS = 86_400_000
+
+
+def _to_exchange_date(ts: np.ndarray, meta: dict) -> np.ndarray:
+	# yf.download (ignore_tz=True for 1d/1wk) returns the exchange-local calendar date, which
+	# fetch_yahoo labels as UTC midnight; the chart API uses the session time. Match yfinance.
+	tz = meta.get("exchangeTimezoneName")
+	if tz:
+		local = pd.to_datetime(ts, unit="ms", utc=True).tz_convert(tz).normalize().tz_localize(None)
+		return local.as_unit("ms").asi8.astype(np.int64)
+	local = ts + int(meta.get("gmtoffset") or 0) * 1000
+	return local - local % _DAY_MS
+
+
+def decode_yahoo_chart(payload: bytes, daily: bool = False) -> OHLCV:
+	"""
+	Parse a /v8/finance/chart body; null bars (no close) are dropped like yf.download does.
+	With `daily` (1d/1wk), bars are stamped at UTC midnight of the exchange-local date, as the
+	yfinance path in fetch_yahoo does, so alert keys match whichever path served the bar.
+	"""
+	result = (json.loads(payload).get("chart") or {}).get("result") or []
+	if not result or not result[0].get("timestamp"):
+		return empty_ohlcv()
+	res = result[0]
+	quote = res["indicators"]["quote"][0]
+	ts = np.array(res["timestamp"], dtype=np.int64) * 1000
+	if daily:
+		ts = _to_exchange_date(ts, res.get("meta") or {})
+	cols = {c: np.array(quote.get(c) or [np.nan] * len(ts), dtype=np.float64) for c in OHLCV_COLUMNS}
+	keep = ~np.isnan(cols["close"])
+	if not keep.all():
+		ts = ts[keep]
+		cols = {c: a[keep] for c, a in cols.items()}
+	return OHLCV(time=ts, **cols)
@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Deque, Dict, List, Optional
+
+import requests
+
+from config import (
+	CIRCUIT_COOLDOWN_SECS,
+	CIRCUIT_FAIL_THRESHOLD,
+	HEDGE_DEFAULT_DELAY_SECS,
+	HEDGE_ENABLED,
+	HEDGE_MAX_ATTEMPTS,
+	HEDGE_MIN_DELAY_SECS,
+	LATENCY_WINDOW,
+	RATE_LIMIT_BACKOFF_SECS,
+	REQUEST_TIMEOUT_SECS,
+)
+
+
+# Statuses that mean "this endpoint is unhealthy", not "the request is wrong"
+_RETRYABLE_STATUS = {500, 502, 503, 504}
+# Rate limited (429) / IP banned (418): the budget is per IP and shared by every host in the pool
+_RATE_LIMIT_STATUS = {418, 429}
+_MIN_SAMPLES = 20
+
+
+class RateLimitedError(requests.HTTPError):
+	"""The provider rate limited this IP; no requests are sent until `retry_after` passes."""
+
+	def __init__(self, message: str, retry_after: float, response: Optional[requests.Response] = None) -> None:
+		super().__init__(message, response=response)
+		self.retry_after = retry_after
+
+
+def _retry_after(r: requests.Response) -> float:
+	try:
+		return max(0.0, float(r.headers.get("Retry-After", "")))
+	except ValueError:
+		return RATE_LIMIT_BACKOFF_SECS
+
+
+def _percentile(values: List[float], q: float) -> float:
+	ordered = sorted(values)
+	idx = min(len(ordered) - 1, max(0, int(round(q * (len(ordered) - 1)))))
+	return ordered[idx]
+
+
+class EndpointHealth:
+	"""Rolling latency, error rate and circuit-breaker state for one base URL."""
+
+	def __init__(
+		self,
+		base_url: str,
+		window: int = LATENCY_WINDOW,
+		fail_threshold: int = CIRCUIT_FAIL_THRESHOLD,
+		cooldown: float = CIRCUIT_COOLDOWN_SECS,
+	) -> None:
+		self.base_url = base_url.rstrip("/")
+		self.fail_threshold = fail_threshold
+		self.cooldown = cooldown
+		self.latencies: Deque[float] = deque(maxlen=window)
+		self.error_rate = 0.0  # EWMA of failures
+		self.consecutive_failures = 0
+		self.open_until = 0.0
+
+	def record_success(self, latency: float) -> None:
+		self.latencies.append(latency)
+		self.error_rate *= 0.8
+		self.consecutive_failures = 0
+		self.open_until = 0.0
+
+	def record_failure(self, now: float) -> None:
+		self.error_rate = self.error_rate * 0.8 + 0.2
+		self.consecutive_failures += 1
+		if self.consecutive_failures >= self.fail_threshold:
+			self.open_until = now + self.cooldown
+
+	def is_available(self, now: float) -> bool:
+		# Closed, or cooldown elapsed (half-open: the next attempt decides)
+		return now >= self.open_until
+
+	def p95(self) -> Optional[float]:
+		if len(self.latencies) < _MIN_SAMPLES:
+			return None
+		return _percentile(list(self.latencies), 0.95)
+
+	def score(self) -> float:
+		# Lower is better: typical latency plus a penalty for recent errors
+		base = _percentile(list(self.latencies), 0.5) if self.latencies else HEDGE_DEFAULT_DELAY_SECS
+		return base + self.error_rate * REQUEST_TIMEOUT_SECS
+
+
+class HedgedClient:
+	"""
+	GET against a pool of equivalent endpoints.
+	- Healthiest endpoint goes first; endpoints with an open circuit are skipped.
+	- If no answer by the primary's rolling p95, a duplicate goes to the next endpoint
+	  and whichever answers first wins (the loser still runs and feeds health stats).
+	- A failed attempt fails over to the next endpoint immediately.
+	- 429/418 are not failed over (the per-IP budget is shared): the whole client backs off
+	  for Retry-After and raises RateLimitedError until then, without touching circuits.
+	Other 4xx answers are returned as-is; the caller decides.
+	"""
+
+	def __init__(
+		self,
+		endpoints: List[str],
+		hedge: bool = HEDGE_ENABLED,
+		max_attempts: int = HEDGE_MAX_ATTEMPTS,
+		timeout: float = REQUEST_TIMEOUT_SECS,
+		fail_threshold: int = CIRCUIT_FAIL_THRESHOLD,
+		cooldown: float = CIRCUIT_COOLDOWN_SECS,
+	) -> None:
+		if not endpoints:
+			raise ValueError("HedgedClient needs at least one endpoint")
+		self.health: Dict[str, EndpointHealth] = {
+			e.rstrip("/"): EndpointHealth(e, fail_threshold=fail_threshold, cooldown=cooldown) for e in endpoints
+		}
+		self.backoff_until = 0.0  # monotonic; client-wide rate-limit backoff
+		self.hedge = hedge
+		self.max_attempts = max(1, max_attempts)
+		self.timeout = timeout
+		self._lock = threading.Lock()
+		workers = max(2, len(endpoints) * 2)
+		self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="hedge")
+		# One pooled session for all hosts: primaries and hedges reuse warm connections instead of
+		# paying a TCP+TLS handshake each (which would also inflate the p95 hedge delay)
+		self.session = requests.Session()
+		adapter = requests.adapters.HTTPAdapter(pool_connections=len(endpoints), pool_maxsize=workers)
+		self.session.mount("http://", adapter)
+		self.session.mount("https://", adapter)
+
+	def _ordered(self, now: float) -> List[EndpointHealth]:
+		with self._lock:
+			eps = list(self.health.values())
+			available = [h for h in eps if h.is_available(now)]
+			if not available:
+				# Everything is tripped: try the one that reopens soonest rather than failing outright
+				available = [min(eps, key=lambda h: h.open_until)]
+			return sorted(available, key=lambda h: h.score())
+
+	def hedge_delay(self, endpoint: EndpointHealth) -> float:
+		with self._lock:
+			p95 = endpoint.p95()
+		delay = HEDGE_DEFAULT_DELAY_SECS if p95 is None else p95
+		return min(self.timeout, max(HEDGE_MIN_DELAY_SECS, delay))
+
+	def _attempt(self, ep: EndpointHealth, path: str, params, headers) -> requests.Response:
+		t0 = time.monotonic()
+		try:
+			r = self.session.get(ep.base_url + path, params=params, headers=headers, timeout=self.timeout)
+		except requests.RequestException:
+			with self._lock:
+				ep.record_failure(time.monotonic())
+			raise
+		latency = time.monotonic() - t0
+		if r.status_code in _RATE_LIMIT_STATUS:
+			# Not the endpoint's fault: leave its health alone, back off the whole pool
+			retry_after = _retry_after(r)
+			with self._lock:
+				self.backoff_until = max(self.backoff_until, time.monotonic() + retry_after)
+			raise RateLimitedError(f"{r.status_code} from {ep.base_url}", retry_after, response=r)
+		with self._lock:
+			if r.status_code in _RETRYABLE_STATUS:
+				ep.record_failure(time.monotonic())
+			else:
+				ep.record_success(latency)
+		if r.status_code in _RETRYABLE_STATUS:
+			raise requests.HTTPError(f"{r.status_code} from {ep.base_url}", response=r)
+		return r
+
+	def _backoff_remaining(self) -> float:
+		with self._lock:
+			return max(0.0, self.backoff_until - time.monotonic())
+
+	def get(self, path: str, params: Optional[dict] = None, headers: Optional[dict] = None) -> requests.Response:
+		remaining = self._backoff_remaining()
+		if remaining > 0:
+			raise RateLimitedError(f"rate limited, backing off {remaining:.1f}s", remaining)
+		candidates = self._ordered(time.monotonic())[: self.max_attempts]
+		pending: Dict[Future, EndpointHealth] = {}
+		last_exc: Optional[Exception] = None
+		rate_limit_exc: Optional[RateLimitedError] = None
+		next_idx = 0
+
+		def launch() -> EndpointHealth:
+			nonlocal next_idx
+			ep = candidates[next_idx]
+			next_idx += 1
+			pending[self._executor.submit(self._attempt, ep, path, params, headers)] = ep
+			return ep
+
+		primary = launch()
+		while pending:
+			# No hedging or failover while the pool is backing off (set by any attempt, this call's or another's)
+			can_hedge = self.hedge and next_idx < len(candidates) and not self._backoff_remaining()
+			done, _ = wait(
+				list(pending),
+				timeout=self.hedge_delay(primary) if can_hedge else None,
+				return_when=FIRST_COMPLETED,
+			)
+			if not done:
+				# Primary is in its tail: send a duplicate to the next endpoint
+				primary = launch()
+				continue
+			for fut in done:
+				pending.pop(fut)
+				try:
+					return fut.result()
+				except RateLimitedError as e:
+					rate_limit_exc = e
+				except requests.RequestException as e:
+					last_exc = e
+			if not pending and next_idx < len(candidates) and not self._backoff_remaining():
+				primary = launch()
+		if rate_limit_exc is not None:
+			raise rate_limit_exc
+		assert last_exc is not None
+		raise last_exc
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Dict, List, Tuple
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
 
 import pandas as pd
 
@@ -13,8 +14,28 @@ from config import (
 	TIMEFRAMES,
     CONFIRM_RIGHT,
 )
-from data_sources import fetch_binance_klines, fetch_yahoo
-from indicators import detect_bullish_regular_divergence
+from data_sources import fetch_binance_klines, fetch_yahoo, resolve_binance_symbol
+from indicators import DivergenceSignal, detect_bullish_regular_divergence
+
+
+_TURNOVER_BARS = 20
+_REQUIRED = ["open", "high", "low", "close", "volume"]
+
+
+@dataclass
+class ScanResult:
+	signals: List[DivergenceSignal] = field(default_factory=list)
+	turnover: Optional[float] = None  # avg close * volume over the last bars, None if no data
+	quote: Optional[str] = None  # currency the turnover is in ("TRY" / "USDT")
+
+
+def _quote_currency(symbol: str, source: str) -> Optional[str]:
+	if source == "yahoo":
+		return "TRY"  # BIST
+	resolved = resolve_binance_symbol(symbol)
+	if resolved is None:
+		return None
+	return "USDT" if resolved.endswith("USDT") else "TRY"
 
 
 def _empty_df() -> pd.DataFrame:
@@ -24,6 +45,9 @@ def _empty_df() -> pd.DataFrame:
 def _normalize_ohlcv(df: pd.DataFrame) -> pd.DataFrame:
 	if df is None or len(df) == 0:
 		return _empty_df()
+	# Already normalized (decoded chart payload): skip the rename work
+	if list(df.columns) == _REQUIRED:
+		return df
 	# Flatten MultiIndex columns if present
 	if isinstance(df.columns, pd.MultiIndex):
 		df.columns = ["_".join([str(p) for p in col if p is not None]) for col in df.columns.to_list()]
@@ -69,10 +93,15 @@ def _fetch(symbol: str, source: str, timeframe: str) -> pd.DataFrame:
 
 
 def scan_symbol_timeframe(symbol: str, source: str, timeframe: str, confirm: bool | None = None):
+	return scan_symbol_timeframe_stats(symbol, source, timeframe, confirm).signals
+
+
+def scan_symbol_timeframe_stats(symbol: str, source: str, timeframe: str, confirm: bool | None = None) -> ScanResult:
+	"""Like scan_symbol_timeframe, also returning the recent turnover used by the scan scheduler."""
 	df = _fetch(symbol, source, timeframe)
 	# Ensure required columns
 	if df is None or len(df) == 0 or not all(c in df.columns for c in ["open", "high", "low", "close", "volume"]):
-		return []
+		return ScanResult()
 	# Closed-candle policy:
 	# - If confirming right pivots (like Pine offset=-lbR), we must wait for lbR bars -> drop last lbR bars
 	# - If instant alerts requested, use only last closed bar -> drop last 1 bar while scanning pivots across history
@@ -84,8 +113,14 @@ def scan_symbol_timeframe(symbol: str, source: str, timeframe: str, confirm: boo
 		if len(df) > 1:
 			df = df.iloc[:-1]
 	if len(df) == 0:
-		return []
-	return detect_bullish_regular_divergence(
+		return ScanResult()
+	# Turnover from closed bars only; the open candle's partial volume would skew it
+	recent = df.tail(_TURNOVER_BARS)
+	turnover: Optional[float] = float((recent["close"] * recent["volume"]).mean())
+	if turnover != turnover:  # NaN
+		turnover = None
+	result = ScanResult(turnover=turnover, quote=_quote_currency(symbol, source) if turnover is not None else None)
+	result.signals = detect_bullish_regular_divergence(
 		close=df["close"],
 		high=df["high"],
 		low=df["low"],
@@ -97,5 +132,4 @@ def scan_symbol_timeframe(symbol: str, source: str, timeframe: str, confirm: boo
 		symbol=symbol,
 		timeframe=timeframe,
 	)
-
-
+	return result
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import math
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from config import (
+	PRIORITY_SYMBOLS,
+	PRIORITY_WEIGHT_LIQUIDITY,
+	PRIORITY_WEIGHT_PINNED,
+	PRIORITY_WEIGHT_SIGNALS,
+	PRIORITY_WEIGHT_STALENESS,
+	PRIORITY_WEIGHT_TIMEFRAME,
+	SIGNAL_DECAY,
+	TIMEFRAME_PRIORITY,
+)
+from symbols import BINANCE_PRIORITY
+
+
+_TIMEFRAME_SECS = {
+	"1h": 3600,
+	"4h": 4 * 3600,
+	"1d": 24 * 3600,
+	"1w": 7 * 24 * 3600,
+}
+# Bars are aligned to UTC boundaries; weekly bars start Monday (the epoch was a Thursday)
+_TIMEFRAME_OFFSET_SECS = {"1w": 4 * 24 * 3600}
+
+
+def bars_closed_between(timeframe: str, start: float, end: float) -> int:
+	"""Number of `timeframe` bar closes in (start, end]."""
+	period = _TIMEFRAME_SECS.get(timeframe, 3600)
+	offset = _TIMEFRAME_OFFSET_SECS.get(timeframe, 0)
+	return max(0, math.floor((end - offset) / period) - math.floor((start - offset) / period))
+
+
+@dataclass
+class WorkStats:
+	last_scan: Optional[float] = None  # time.time() of last completed scan
+	first_planned: Optional[float] = None  # when plan() first saw the pair (staleness of never-scanned pairs)
+	turnover: Optional[float] = None  # recent avg close * volume
+	quote: Optional[str] = None  # currency of turnover
+	signal_score: float = 0.0  # exponentially decayed signal count
+
+
+class ScanScheduler:
+	"""
+	Order (symbol, timeframe) work by a weighted priority score:
+	- liquidity: recent turnover, log min-max scaled among pairs of the same timeframe and
+	  quote currency (per-bar turnover grows with bar length; TRY and USDT are not comparable)
+	- signals: recent divergence frequency for the pair
+	- timeframe: static weight from TIMEFRAME_PRIORITY
+	- staleness: bar closes missed since the last scan (never scanned = 1 + closes since first
+	  planned). 0 while no new bar has closed (nothing new to find), and uncapped, so pairs
+	  deferred by a tight budget keep gaining until they outrank pinned/liquid pairs instead of starving
+	- pinned: well-known majors (BINANCE_PRIORITY + PRIORITY_SYMBOLS)
+	"""
+
+	def __init__(
+		self,
+		weights: Optional[Dict[str, float]] = None,
+		timeframe_priority: Optional[Dict[str, float]] = None,
+		pinned: Optional[Iterable[str]] = None,
+		signal_decay: float = SIGNAL_DECAY,
+	) -> None:
+		self.weights = {
+			"liquidity": PRIORITY_WEIGHT_LIQUIDITY,
+			"signals": PRIORITY_WEIGHT_SIGNALS,
+			"timeframe": PRIORITY_WEIGHT_TIMEFRAME,
+			"staleness": PRIORITY_WEIGHT_STALENESS,
+			"pinned": PRIORITY_WEIGHT_PINNED,
+		}
+		if weights:
+			self.weights.update(weights)
+		self.timeframe_priority = dict(TIMEFRAME_PRIORITY if timeframe_priority is None else timeframe_priority)
+		self.pinned = set(list(BINANCE_PRIORITY) + list(PRIORITY_SYMBOLS) if pinned is None else pinned)
+		self.signal_decay = signal_decay
+		self._stats: Dict[Tuple[str, str], WorkStats] = {}
+
+	def _get(self, symbol: str, timeframe: str) -> WorkStats:
+		key = (symbol, timeframe)
+		if key not in self._stats:
+			self._stats[key] = WorkStats()
+		return self._stats[key]
+
+	def score(
+		self,
+		symbol: str,
+		timeframe: str,
+		now: Optional[float] = None,
+		log_ranges: Optional[Dict[Tuple[str, Optional[str]], Tuple[float, float]]] = None,
+	) -> float:
+		now = time.time() if now is None else now
+		st = self._get(symbol, timeframe)
+		if log_ranges is None:
+			log_ranges = self._log_turnover_ranges()
+
+		liquidity = 0.0
+		if st.turnover is not None:
+			lo, hi = log_ranges.get((timeframe, st.quote), (0.0, 0.0))
+			liquidity = (math.log1p(max(st.turnover, 0.0)) - lo) / (hi - lo) if hi > lo else 1.0
+		signals = 1.0 - math.exp(-st.signal_score)  # 0 -> 0, saturates towards 1
+		tf_weight = self.timeframe_priority.get(timeframe, 0.0)
+		if st.last_scan is None:
+			since = now if st.first_planned is None else st.first_planned
+			staleness = 1.0 + bars_closed_between(timeframe, since, now)
+		else:
+			staleness = float(bars_closed_between(timeframe, st.last_scan, now))
+		pinned = 1.0 if symbol in self.pinned else 0.0
+
+		w = self.weights
+		return (
+			w["liquidity"] * liquidity
+			+ w["signals"] * signals
+			+ w["timeframe"] * tf_weight
+			+ w["staleness"] * staleness
+			+ w["pinned"] * pinned
+		)
+
+	def _log_turnover_ranges(self) -> Dict[Tuple[str, Optional[str]], Tuple[float, float]]:
+		# (timeframe, quote) -> (min, max) of log1p(turnover)
+		ranges: Dict[Tuple[str, Optional[str]], Tuple[float, float]] = {}
+		for (_, tf), st in self._stats.items():
+			if st.turnover is None:
+				continue
+			v = math.log1p(max(st.turnover, 0.0))
+			lo, hi = ranges.get((tf, st.quote), (v, v))
+			ranges[(tf, st.quote)] = (min(lo, v), max(hi, v))
+		return ranges
+
+	def plan(self, symbols: Iterable[str], timeframes: Iterable[str], now: Optional[float] = None) -> List[Tuple[str, str]]:
+		"""Return all (symbol, timeframe) pairs, highest priority first."""
+		now = time.time() if now is None else now
+		log_ranges = self._log_turnover_ranges()
+		work = [(s, tf) for tf in timeframes for s in symbols]
+		for s, tf in work:
+			st = self._get(s, tf)
+			if st.first_planned is None:
+				st.first_planned = now
+		scored = [(self.score(s, tf, now, log_ranges), s, tf) for s, tf in work]
+		# Stable tie-break on symbol/timeframe so ordering is deterministic
+		scored.sort(key=lambda x: (-x[0], x[1], x[2]))
+		return [(s, tf) for _, s, tf in scored]
+
+	def record_scan(
+		self,
+		symbol: str,
+		timeframe: str,
+		signal_count: int = 0,
+		turnover: Optional[float] = None,
+		quote: Optional[str] = None,
+		now: Optional[float] = None,
+	) -> None:
+		st = self._get(symbol, timeframe)
+		st.last_scan = time.time() if now is None else now
+		st.signal_score = st.signal_score * self.signal_decay + signal_count
+		if turnover is not None:
+			st.turnover = turnover
+			st.quote = quote
+
+
+def within_budget(
+	work: Iterable[Tuple[str, str]],
+	deadline: Optional[float],
+	clock: Callable[[], float] = time.time,
+) -> Iterator[Tuple[str, str]]:
+	"""Yield planned work until `deadline` (same clock) passes; the rest is deferred. None = no limit."""
+	for item in work:
+		if deadline is not None and clock() >= deadline:
+			return
+		yield item
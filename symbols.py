@@ -6,6 +6,12 @@ from typing import Dict, List, Tuple
 from config import BIST_LIST_PATH, MIDAS_LIST_PATH, MAX_SYMBOLS_PER_SOURCE
 
 
+# Well-known liquid majors; also boosted by the worker's scan scheduler
+BINANCE_PRIORITY = [
+	"BTCTRY","ETHTRY","BNBTRY","SOLTRY","ADATRY","XRPTRY","AVAXTRY","DOTTRY","LINKTRY","LTCTRY",
+]
+
+
 def load_bist_from_text(path: str = BIST_LIST_PATH) -> List[str]:
 	# Parse tokens like AKBNK, THYAO into Yahoo symbols: AKBNK.IS
 	with open(path, "r", encoding="utf-8") as f:
@@ -40,10 +46,7 @@ def load_binance_from_text(path: str = MIDAS_LIST_PATH) -> List[str]:
 			seen.add(t)
 			uniq.append(t)
 	# Prefer well-known majors first to reduce 400 errors
-	priority = [
-		"BTCTRY","ETHTRY","BNBTRY","SOLTRY","ADATRY","XRPTRY","AVAXTRY","DOTTRY","LINKTRY","LTCTRY",
-	]
-	ordered = [t for t in priority if t in uniq]
+	ordered = [t for t in BINANCE_PRIORITY if t in uniq]
 	for t in uniq:
 		if t not in ordered:
 			ordered.append(t)
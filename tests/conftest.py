@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Flat repo layout: make the top-level modules importable from tests/
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import json
+import random
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import data_sources
+from bench_decode import _binance_payload, _yahoo_payload, legacy_binance, legacy_yahoo
+from decode import decode_binance_klines, decode_yahoo_chart
+
+
+# Istanbul session opens 10:00 local = 07:00 UTC
+_SESSION_TS = [1760598000, 1760684400]  # 2025-10-16, 2025-10-17 07:00 UTC
+
+
+def _chart(timestamps, meta: dict | None = None, close=None) -> bytes:
+	n = len(timestamps)
+	close = close if close is not None else [float(i + 1) for i in range(n)]
+	quote = {"open": close, "high": close, "low": close, "close": close, "volume": [100] * n}
+	result = {"meta": meta or {}, "timestamp": timestamps, "indicators": {"quote": [quote]}}
+	return json.dumps({"chart": {"result": [result]}}).encode()
+
+
+def _yfinance_path_index(monkeypatch, local_dates) -> pd.DatetimeIndex:
+	# Run fetch_yahoo's yfinance fallback on what yf.download returns for 1d/1wk (ignore_tz=True: naive local dates)
+	frame = pd.DataFrame(
+		{"Open": 1.0, "High": 1.0, "Low": 1.0, "Close": 1.0, "Adj Close": 1.0, "Volume": 100.0},
+		index=pd.DatetimeIndex(local_dates, name="Date"),
+	)
+
+	def no_chart(symbol, intv):
+		raise ConnectionError("chart API down")
+
+	monkeypatch.setattr(data_sources, "_fetch_yahoo_chart", no_chart)
+	monkeypatch.setattr(data_sources.yf, "download", lambda **kwargs: frame)
+	return data_sources.fetch_yahoo("THYAO.IS", "1d").index
+
+
+@pytest.mark.parametrize("meta", [{"exchangeTimezoneName": "Europe/Istanbul"}, {"gmtoffset": 10800}])
+def test_daily_chart_bars_match_yfinance_fallback_keys(monkeypatch, meta):
+	chart_index = decode_yahoo_chart(_chart(_SESSION_TS, meta), daily=True).to_frame().index
+	yf_index = _yfinance_path_index(monkeypatch, ["2025-10-16", "2025-10-17"])
+
+	assert [t.isoformat() for t in chart_index] == [t.isoformat() for t in yf_index]
+	assert chart_index[0].isoformat() == "2025-10-16T00:00:00+00:00"
+
+
+def test_intraday_chart_bars_keep_session_time():
+	index = decode_yahoo_chart(_chart(_SESSION_TS, {"exchangeTimezoneName": "Europe/Istanbul"})).to_frame().index
+	assert index[0].isoformat() == "2025-10-16T07:00:00+00:00"
+
+
+def _kline(i: int) -> list:
+	t = 1_700_000_000_000 + i * 3_600_000
+	return [t, f"{10 + i}.5", f"{11 + i}.0", f"{9 + i}.0", f"{10 + i}.25", "1234.5", t + 3_599_999, "0", 7, "0", "0", "0"]
+
+
+def _assert_frames_equal(actual: pd.DataFrame, expected: pd.DataFrame) -> None:
+	assert list(actual.columns) == list(expected.columns)
+	np.testing.assert_array_equal(actual.to_numpy(), expected.to_numpy())
+	assert actual.index.equals(expected.index)
+
+
+def test_binance_decode_matches_legacy_frame():
+	random.seed(1)
+	payload = _binance_payload()
+	_assert_frames_equal(decode_binance_klines(payload).to_frame(), legacy_binance(payload))
+
+
+def test_yahoo_decode_matches_legacy_frame():
+	random.seed(1)
+	payload = _yahoo_payload()  # includes one null bar
+	_assert_frames_equal(decode_yahoo_chart(payload).to_frame(), legacy_yahoo(payload))
+
+
+@pytest.mark.parametrize(
+	"rows",
+	[
+		[_kline(i) + ["13th"] if i % 2 else _kline(i)[:11] for i in range(12)],  # ragged, adds up to 12 * 12
+		[_kline(i) + ["7"] for i in range(12)],  # 13 fields per row
+	],
+	ids=["ragged", "13-wide"],
+)
+def test_binance_bad_row_layout_takes_json_fallback(rows):
+	bars = decode_binance_klines(json.dumps(rows, separators=(",", ":")).encode())
+	assert len(bars) == len(rows)
+	np.testing.assert_array_equal(bars.time, [r[0] for r in rows])
+	np.testing.assert_array_equal(bars.open, [float(r[1]) for r in rows])
+	np.testing.assert_array_equal(bars.close, [float(r[4]) for r in rows])
+
+
+def test_binance_pretty_printed_json_decodes():
+	rows = [_kline(i) for i in range(3)]
+	compact = decode_binance_klines(json.dumps(rows, separators=(",", ":")).encode())
+	pretty = decode_binance_klines(json.dumps(rows, indent=2).encode())
+	_assert_frames_equal(pretty.to_frame(), compact.to_frame())
+
+
+@pytest.mark.parametrize("payload", [b"[]", b'{"code": -1121, "msg": "Invalid symbol."}'])
+def test_binance_empty_or_error_body_is_empty(payload):
+	frame = decode_binance_klines(payload).to_frame()
+	assert len(frame) == 0
+	assert list(frame.columns) == ["open", "high", "low", "close", "volume"]
+
+
+def test_yahoo_null_bars_are_dropped():
+	ts = [1_760_598_000 + i * 3600 for i in range(4)]
+	bars = decode_yahoo_chart(_chart(ts, close=[1.0, None, 3.0, None]))
+	np.testing.assert_array_equal(bars.close, [1.0, 3.0])
+	np.testing.assert_array_equal(bars.time, [ts[0] * 1000, ts[2] * 1000])
+
+
+def test_yahoo_error_body_is_empty():
+	assert len(decode_yahoo_chart(b'{"chart": {"result": null, "error": {"code": "Not Found"}}}')) == 0
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from hedging import HedgedClient, RateLimitedError
+
+
+class StandIn:
+	"""Local HTTP server answering every GET with `status` after `delay` seconds."""
+
+	def __init__(self, status: int = 200, delay: float = 0.0, headers: dict | None = None) -> None:
+		self.status = status
+		self.delay = delay
+		self.headers = headers or {}
+		self.hits = 0
+		self.client_ports: set[int] = set()
+		stand_in = self
+
+		class Handler(BaseHTTPRequestHandler):
+			protocol_version = "HTTP/1.1"  # keep-alive, so connection reuse is observable
+
+			def do_GET(self):
+				stand_in.hits += 1
+				stand_in.client_ports.add(self.client_address[1])
+				time.sleep(stand_in.delay)
+				body = f'{{"port": {self.server.server_port}}}'.encode()
+				self.send_response(stand_in.status)
+				for k, v in stand_in.headers.items():
+					self.send_header(k, v)
+				self.send_header("Content-Length", str(len(body)))
+				self.end_headers()
+				self.wfile.write(body)
+
+			def log_message(self, *args):
+				pass
+
+		self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+		self.server.daemon_threads = True
+		self.url = f"http://127.0.0.1:{self.server.server_port}"
+		threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+	def close(self) -> None:
+		self.server.shutdown()
+		self.server.server_close()
+
+
+@pytest.fixture
+def stand_in():
+	servers = []
+
+	def make(**kwargs) -> StandIn:
+		s = StandIn(**kwargs)
+		servers.append(s)
+		return s
+
+	yield make
+	for s in servers:
+		s.close()
+
+
+def _prefer(client: HedgedClient, server: StandIn) -> None:
+	# Fake a fast history so `server` is picked as primary and its p95 (hedge delay) is tiny
+	client.health[server.url].latencies.extend([0.001] * 30)
+
+
+def test_slow_primary_is_hedged_and_fast_answer_wins(stand_in):
+	slow = stand_in(delay=2.0)
+	fast = stand_in(delay=0.02)
+	client = HedgedClient([slow.url, fast.url])
+	_prefer(client, slow)
+
+	t0 = time.monotonic()
+	r = client.get("/x")
+	elapsed = time.monotonic() - t0
+
+	assert r.json()["port"] == fast.server.server_port
+	assert elapsed < 1.0
+	assert slow.hits == 1 and fast.hits == 1
+
+
+def test_5xx_fails_over_to_next_endpoint(stand_in):
+	bad = stand_in(status=503)
+	good = stand_in()
+	client = HedgedClient([bad.url, good.url], hedge=False)
+	_prefer(client, bad)
+
+	r = client.get("/x")
+
+	assert r.status_code == 200
+	assert r.json()["port"] == good.server.server_port
+	assert client.health[bad.url].consecutive_failures == 1
+
+
+def test_circuit_opens_after_threshold_and_half_opens_after_cooldown(stand_in):
+	bad = stand_in(status=503)
+	good = stand_in()
+	client = HedgedClient([bad.url], fail_threshold=3, cooldown=0.3)
+	health = client.health[bad.url]
+
+	for _ in range(2):
+		with pytest.raises(requests.HTTPError):
+			client.get("/x")
+	assert health.is_available(time.monotonic())
+	with pytest.raises(requests.HTTPError):
+		client.get("/x")
+	assert not health.is_available(time.monotonic())
+
+	# While open, a pool with a healthy sibling skips it entirely
+	pool = HedgedClient([bad.url, good.url], fail_threshold=3, cooldown=0.3)
+	pool.health[bad.url] = health
+	assert [h.base_url for h in pool._ordered(time.monotonic())] == [good.url]
+
+	# Half-open after the cooldown: one more failure reopens immediately...
+	time.sleep(0.35)
+	assert health.is_available(time.monotonic())
+	with pytest.raises(requests.HTTPError):
+		client.get("/x")
+	assert not health.is_available(time.monotonic())
+
+	# ...and one success closes it
+	time.sleep(0.35)
+	bad.status = 200
+	assert client.get("/x").status_code == 200
+	assert health.consecutive_failures == 0
+	assert health.is_available(time.monotonic())
+
+
+def test_all_endpoints_failing_raises_last_error(stand_in):
+	a = stand_in(status=503)
+	b = stand_in(status=502)
+	client = HedgedClient([a.url, b.url], hedge=False)
+
+	with pytest.raises(requests.HTTPError) as exc:
+		client.get("/x")
+
+	assert exc.value.response.status_code in {502, 503}
+	assert a.hits == 1 and b.hits == 1
+
+
+def test_rate_limit_backs_off_without_failover(stand_in):
+	limited = stand_in(status=429, headers={"Retry-After": "1"})
+	other = stand_in()
+	client = HedgedClient([limited.url, other.url])
+	_prefer(client, limited)
+
+	with pytest.raises(RateLimitedError) as exc:
+		client.get("/x")
+	assert exc.value.retry_after == 1.0
+	# Backoff is client-wide: nothing is sent while it lasts, and no circuit is tripped
+	with pytest.raises(RateLimitedError):
+		client.get("/x")
+	assert limited.hits == 1 and other.hits == 0
+	assert client.health[limited.url].consecutive_failures == 0
+
+
+def test_requests_reuse_pooled_connections(stand_in):
+	server = stand_in()
+	client = HedgedClient([server.url], hedge=False)
+
+	for _ in range(3):
+		assert client.get("/x").status_code == 200
+
+	assert server.hits == 3
+	assert len(server.client_ports) == 1
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from scheduler import ScanScheduler, within_budget
+
+
+HOUR = 3600.0
+T0 = 1_760_000_400.0  # 09:00 UTC, on an hour boundary
+
+
+def _scheduler(**weights) -> ScanScheduler:
+	# Only the weights a test names are active
+	base = {"liquidity": 0.0, "signals": 0.0, "timeframe": 0.0, "staleness": 0.0, "pinned": 0.0}
+	base.update(weights)
+	return ScanScheduler(weights=base, timeframe_priority={"1h": 1.0, "1w": 0.25}, pinned=["BTCTRY"])
+
+
+def test_liquidity_is_min_max_scaled_per_timeframe_and_quote():
+	s = _scheduler(liquidity=1.0)
+	for sym, tv in [("A", 1e3), ("B", 1e6), ("C", 1e9)]:
+		s.record_scan(sym, "1h", turnover=tv, quote="TRY", now=T0)
+		s.record_scan(sym, "1w", turnover=tv * 168, quote="TRY", now=T0)  # same symbols, longer bars
+	s.record_scan("X", "1h", turnover=5.0, quote="USDT", now=T0)  # alone in its bucket
+
+	assert s.score("A", "1h", T0) == pytest.approx(0.0)
+	assert s.score("C", "1h", T0) == pytest.approx(1.0)
+	mid = (math.log1p(1e6) - math.log1p(1e3)) / (math.log1p(1e9) - math.log1p(1e3))
+	assert s.score("B", "1h", T0) == pytest.approx(mid)
+	# 1w is ranked among 1w pairs only, so bar length does not inflate liquidity
+	assert s.score("B", "1w", T0) == pytest.approx(s.score("B", "1h", T0), abs=1e-3)
+	# Single-member bucket (hi == lo) gets full liquidity, and USDT is not ranked against TRY
+	assert s.score("X", "1h", T0) == pytest.approx(1.0)
+	assert s.plan(["A", "B", "C", "X"], ["1h"], now=T0) == [("C", "1h"), ("X", "1h"), ("B", "1h"), ("A", "1h")]
+
+
+def test_signal_score_decays_and_saturates():
+	s = _scheduler(signals=1.0)
+	s.signal_decay = 0.5
+	s.record_scan("A", "1h", signal_count=1, now=T0)
+	s.record_scan("A", "1h", signal_count=0, now=T0)
+	s.record_scan("B", "1h", signal_count=1, now=T0)
+
+	assert s._stats[("A", "1h")].signal_score == pytest.approx(0.5)
+	assert s._stats[("B", "1h")].signal_score == pytest.approx(1.0)
+	assert s.score("A", "1h", T0) == pytest.approx(1 - math.exp(-0.5))
+	assert s.plan(["A", "B", "C"], ["1h"], now=T0) == [("B", "1h"), ("A", "1h"), ("C", "1h")]
+
+
+def test_pinned_boost_and_timeframe_weight():
+	s = _scheduler(pinned=1.0, timeframe=0.5)
+	assert s.plan(["AAA", "BTCTRY"], ["1h", "1w"], now=T0) == [
+		("BTCTRY", "1h"),
+		("BTCTRY", "1w"),
+		("AAA", "1h"),
+		("AAA", "1w"),
+	]
+
+
+def test_staleness_counts_bar_closes_since_last_scan():
+	s = _scheduler(staleness=1.0)
+	assert s.score("A", "1h", T0) == 1.0  # never scanned
+	s.plan(["A"], ["1h"], now=T0)
+	assert s.score("A", "1h", T0 + 2 * HOUR) == 3.0  # never scanned, two closes since first planned
+	s.record_scan("A", "1h", now=T0 + 50 * 60)  # 09:50
+	assert s.score("A", "1h", T0 + 59 * 60) == 0.0  # no new close yet
+	assert s.score("A", "1h", T0 + 61 * 60) == 1.0  # 10:00 bar closed
+	assert s.score("A", "1h", T0 + 5 * HOUR) == 5.0  # uncapped: 10:00..14:00 closes, keeps growing while deferred
+
+	stats = s._stats[("A", "1h")]
+	assert stats.last_scan == T0 + 50 * 60
+	assert stats.turnover is None and stats.signal_score == 0.0
+
+
+def test_deferred_pair_eventually_outranks_pinned_major():
+	s = _scheduler(pinned=1.0, staleness=1.0)
+	symbols = ["BTCTRY", "ILLIQ"]
+	scanned = []
+	# Budget allows one scan per hourly cycle: the major goes first until the deferred pair catches up
+	for cycle in range(5):
+		now = T0 + cycle * HOUR + 60
+		first = s.plan(symbols, ["1h"], now=now)[0]
+		scanned.append(first[0])
+		s.record_scan(*first, now=now)
+	assert scanned[0] == "BTCTRY"
+	assert "ILLIQ" in scanned
+
+
+def test_record_scan_keeps_last_known_turnover():
+	s = _scheduler()
+	s.record_scan("A", "1h", turnover=100.0, quote="TRY", now=T0)
+	s.record_scan("A", "1h", now=T0 + HOUR)
+	stats = s._stats[("A", "1h")]
+	assert (stats.turnover, stats.quote, stats.last_scan) == (100.0, "TRY", T0 + HOUR)
+
+
+def test_within_budget_defers_the_tail():
+	work = [("A", "1h"), ("B", "1h"), ("C", "1h"), ("D", "1h")]
+	ticks = iter([0.0, 1.0, 2.0, 3.0])
+	assert list(within_budget(work, deadline=2.0, clock=lambda: next(ticks))) == [("A", "1h"), ("B", "1h")]
+	assert list(within_budget(work, deadline=None)) == work
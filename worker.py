@@ -5,9 +5,10 @@ import time
 from datetime import datetime, timezone
 from typing import Dict, List, Tuple
 
-from config import TIMEFRAMES, TELEGRAM_BOT_TOKEN, TELEGRAM_CHAT_ID
+from config import SCAN_BUDGET_SECS, TIMEFRAMES, TELEGRAM_BOT_TOKEN, TELEGRAM_CHAT_ID
 from notifier import notify_if_new
-from scanner import scan_symbol_timeframe
+from scanner import scan_symbol_timeframe_stats
+from scheduler import ScanScheduler, within_budget
 from symbols import build_unified_symbol_map
 
 
@@ -17,6 +18,7 @@ SCAN_INTERVAL_SECS = int(os.getenv("SCAN_INTERVAL_SECS", 60))
 def main():
     symbol_map = build_unified_symbol_map()  # display -> (source, code)
     all_display = sorted(symbol_map.keys())
+    scheduler = ScanScheduler()
 
     print(f"Loaded {len(all_display)} symbols. Starting worker...")
     if not TELEGRAM_BOT_TOKEN or not TELEGRAM_CHAT_ID:
@@ -26,29 +28,41 @@ def main():
         start = time.time()
         utc_now = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S %Z")
         print(f"\n[SCAN] {utc_now}")
+        # Highest priority first; when the budget runs out the tail is deferred to the next cycle
+        work = scheduler.plan(all_display, TIMEFRAMES, now=start)
+        deadline = start + SCAN_BUDGET_SECS if SCAN_BUDGET_SECS > 0 else None
+        sent_counts: Dict[str, int] = {tf: 0 for tf in TIMEFRAMES}
+        done = 0
+        for disp, tf in within_budget(work, deadline):
+            done += 1
+            source, code = symbol_map[disp]
+            try:
+                result = scan_symbol_timeframe_stats(code, source, tf, confirm=False)
+            except Exception as e:
+                print(f"[ERR] {disp} {tf}: {e}")
+                scheduler.record_scan(disp, tf)
+                continue
+            signals = result.signals
+            if not signals:
+                scheduler.record_scan(disp, tf, turnover=result.turnover, quote=result.quote)
+                continue
+            sig = signals[-1]
+            text = (
+                f"*RSI Bullish Divergence*\n"
+                f"{sig.symbol} | {sig.timeframe} | {sig.bar_time.strftime('%Y-%m-%d %H:%M UTC')}\n"
+                f"RSI: {sig.prev_rsi_pivot:.2f} -> {sig.rsi_at_pivot:.2f} (HL)\n"
+                f"Low: {sig.prev_price_pivot:.4f} -> {sig.price_at_pivot:.4f} (LL)"
+            )
+            key = f"{sig.symbol}:{sig.timeframe}:{sig.bar_time.isoformat()}"
+            sent = notify_if_new(key, text)
+            if sent:
+                sent_counts[tf] += 1
+            scheduler.record_scan(disp, tf, signal_count=int(sent), turnover=result.turnover, quote=result.quote)
         for tf in TIMEFRAMES:
-            sent_count = 0
-            for disp in all_display:
-                source, code = symbol_map[disp]
-                try:
-                    signals = scan_symbol_timeframe(code, source, tf, confirm=False)
-                except Exception as e:
-                    print(f"[ERR] {disp} {tf}: {e}")
-                    continue
-                if not signals:
-                    continue
-                sig = signals[-1]
-                text = (
-                    f"*RSI Bullish Divergence*\n"
-                    f"{sig.symbol} | {sig.timeframe} | {sig.bar_time.strftime('%Y-%m-%d %H:%M UTC')}\n"
-                    f"RSI: {sig.prev_rsi_pivot:.2f} -> {sig.rsi_at_pivot:.2f} (HL)\n"
-                    f"Low: {sig.prev_price_pivot:.4f} -> {sig.price_at_pivot:.4f} (LL)"
-                )
-                key = f"{sig.symbol}:{sig.timeframe}:{sig.bar_time.isoformat()}"
-                if notify_if_new(key, text):
-                    sent_count += 1
-            print(f"[TF {tf}] sent={sent_count}")
-        
+            print(f"[TF {tf}] sent={sent_counts[tf]}")
+        if done < len(work):
+            print(f"[SCAN] budget reached; deferred {len(work) - done} of {len(work)} symbol/timeframe pairs")
+
         elapsed = time.time() - start
         sleep_left = max(1, SCAN_INTERVAL_SECS - int(elapsed))
         time.sleep(sleep_left)